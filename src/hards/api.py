@@ -1,8 +1,9 @@
 """The abstract API for managing hierarchical datasets in Python."""
 
 import abc
+import re
 import string
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 from typing import Any, Optional
 
@@ -13,6 +14,10 @@ VALID_NAME_CHARACTERS = set(string.ascii_letters + string.digits + "._-")
 files.
 """
 
+_match_valid_name = re.compile(r"[A-Za-z0-9._\-]+").fullmatch
+# deletes the valid characters from a name, leaving only the invalid ones
+_DELETE_VALID_NAME_CHARACTERS = str.maketrans("", "", "".join(VALID_NAME_CHARACTERS))
+
 
 class HARDSError(Exception):
     """Parent exception for any custom exceptions in the HARDS package."""
@@ -30,13 +35,48 @@ class InvalidNameError(HARDSError):
     """An error for attempting to create an object whose name contains invalid chars."""
 
 
+def _check_name(name: str, kind: str) -> None:
+    # ASCII identifiers are the most common names and are all valid, checking for them
+    # first is quicker than matching the regex
+    if (name.isascii() and name.isidentifier()) or _match_valid_name(name):
+        return
+
+    if not name:
+        error_msg = f"{kind} cannot be empty."
+        raise InvalidNameError(error_msg)
+
+    invalid_chars = set(name.translate(_DELETE_VALID_NAME_CHARACTERS))
+    error_msg = f"{kind} contains invalid characters: {invalid_chars}"
+    raise InvalidNameError(error_msg)
+
+
+def _split_dataset_path(name: str) -> list[str]:
+    # empty names (from leading, trailing or repeated slashes) are skipped so that
+    # "a//b/" follows the same datasets as "a/b". Only repeated slashes leave empty
+    # names after stripping, which is rare, so the names are only filtered then.
+    dataset_names = name.strip("/").split("/")
+    if "" in dataset_names:
+        dataset_names = [dataset_name for dataset_name in dataset_names if dataset_name]
+
+    if not dataset_names:
+        error_msg = f"'{name}' does not name a dataset."
+        raise DoesNotExistError(error_msg)
+
+    return dataset_names
+
+
 class _AbstractHasChildrenDatasetsMixin(abc.ABC):
     """An abstract mixin for classes that have datasets as children."""
 
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def children(self) -> Sequence[str]:
-        """The names of the object's current children (datasets)."""
+        """The names of the object's current children (datasets).
+
+        The order of the names is not specified.
+        """
 
     @abc.abstractmethod
     def get_dataset(self, name: str) -> "AbstractDataset":
@@ -97,10 +137,7 @@ class _AbstractHasChildrenDatasetsMixin(abc.ABC):
             If the dataset name contains invalid character.
 
         """
-        invalid_chars = set(name) - VALID_NAME_CHARACTERS
-        if len(invalid_chars) > 0:
-            error_msg = f"Dataset name contains invalid characters: {invalid_chars}"
-            raise InvalidNameError(error_msg)
+        _check_name(name, "Dataset name")
 
     def recursively_get_dataset(self, name: str) -> "AbstractDataset":
         """Recursively follow a tree of datasets and return the final dataset.
@@ -122,15 +159,11 @@ class _AbstractHasChildrenDatasetsMixin(abc.ABC):
             If any of the intermediate datasets do not exist.
 
         """
-        dataset_names = name.strip("/").split("/")
-        next_dataset_name = dataset_names[0]
-
-        if len(dataset_names) == 1:
-            return self.get_dataset(next_dataset_name)
+        dataset = self
+        for dataset_name in _split_dataset_path(name):
+            dataset = dataset.get_dataset(dataset_name)
 
-        return self.get_dataset(next_dataset_name).recursively_get_dataset(
-            "/".join(dataset_names[1:])
-        )
+        return dataset
 
     def recursively_get_datapoint(self, name: str) -> "AbstractDatapoint":
         """Recurisvely follow a tree of datasets and return a datapoint.
@@ -152,10 +185,10 @@ class _AbstractHasChildrenDatasetsMixin(abc.ABC):
             If any of the intermediate datasets or the datapoint does not exist.
 
         """
-        name_list = name.split("/")
-        dataset = self.recursively_get_dataset("/".join(name_list[:-1]))
+        dataset_name, _, datapoint_name = name.rpartition("/")
+        dataset = self.recursively_get_dataset(dataset_name)
 
-        return dataset.get_datapoint(name_list[-1])
+        return dataset.get_datapoint(datapoint_name)
 
 
 class _AbstractHasDataAndFilesMixin(abc.ABC):
@@ -164,6 +197,8 @@ class _AbstractHasDataAndFilesMixin(abc.ABC):
     The data must be a key-value pair store (dictionary) that is JSON serialisable.
     """
 
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def data(self) -> dict[str, Any]: ...
@@ -185,7 +220,10 @@ class _AbstractHasDataAndFilesMixin(abc.ABC):
     @property
     @abc.abstractmethod
     def files(self) -> Sequence[str]:
-        """The list of file names (including extensions)."""
+        """The list of file names (including extensions).
+
+        The order of the names is not specified.
+        """
 
     @abc.abstractmethod
     def get_file(self, name: str) -> Path:
@@ -239,16 +277,18 @@ class _AbstractHasDataAndFilesMixin(abc.ABC):
             if a name is not explicitly provided.
 
         """
-        if name is not None:
-            invalid_chars = set(name) - VALID_NAME_CHARACTERS
-            if len(invalid_chars) > 0:
-                error_msg = f"Filename contains invalid characters: {invalid_chars}"
-                raise InvalidNameError(error_msg)
+        # an empty name, like no name, keeps the file's own name
+        if name:
+            _check_name(name, "Filename")
 
 
 class _TreeNode(abc.ABC):
     """Abstract base class for all 'nodes' in the HARDS tree."""
 
+    # the nodes' names are cached in these attributes when they are first needed, and
+    # nodes can still be weakly referenced
+    __slots__ = ("__weakref__", "_fullname", "_path_to_database")
+
     @property
     def is_database(self) -> bool:
         """True if the object is the database (root node).
@@ -271,16 +311,33 @@ class _TreeNode(abc.ABC):
         """Recursively find the database."""
         return self.parent.database()
 
-    def path_to_database(self) -> list[str]:
-        """Return the names of this object and the intermediates to the database."""
-        names = []
+    def _names_to_database(self) -> tuple[str, ...]:
+        # names cannot change after instantiation so the path is only built once and
+        # can be extended by children without walking back up the tree
+        uncached = []
         node = self
 
+        # walk up (with a loop rather than recursion so deep trees cannot exceed the
+        # recursion limit) to the first node that already knows its path
         while not node.is_database:
-            names.append(node.name)
-            node = node.parent
+            try:
+                names = node._path_to_database  # noqa: SLF001
+                break
+            except AttributeError:
+                uncached.append(node)
+                node = node.parent
+        else:
+            names = ()
+
+        for node in reversed(uncached):
+            names = (*names, node.name)
+            node._path_to_database = names  # noqa: SLF001
 
-        return names[::-1]
+        return names
+
+    def path_to_database(self) -> list[str]:
+        """Return the names of this object and the intermediates to the database."""
+        return list(self._names_to_database())
 
     def fullname(self) -> str:
         """Return full name of the object.
@@ -288,7 +345,11 @@ class _TreeNode(abc.ABC):
         This is the name that, when calling a recursive get method on the database
         would return a new instantiation of this object.
         """
-        return "/".join(self.path_to_database())
+        try:
+            return self._fullname
+        except AttributeError:
+            self._fullname = "/".join(self._names_to_database())
+            return self._fullname
 
 
 class AbstractDatabase(_TreeNode, _AbstractHasChildrenDatasetsMixin):
@@ -297,6 +358,8 @@ class AbstractDatabase(_TreeNode, _AbstractHasChildrenDatasetsMixin):
     A database defines the root node of the hierarchical data management tree.
     """
 
+    __slots__ = ()
+
     @property
     def is_database(self) -> bool:
         """Returns true because this object does represent a database."""
@@ -326,6 +389,8 @@ class AbstractDataset(
     share their data.
     """
 
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def name(self) -> str:
@@ -334,7 +399,10 @@ class AbstractDataset(
     @property
     @abc.abstractmethod
     def datapoints(self) -> Sequence[str]:
-        """The names of the Dataset's current datapoints."""
+        """The names of the Dataset's current datapoints.
+
+        The order of the names is not specified.
+        """
 
     @abc.abstractmethod
     def get_datapoint(self, name: str) -> "AbstractDatapoint":
@@ -383,10 +451,7 @@ class AbstractDataset(
             If the datapoint name contains invalid characters.
 
         """
-        invalid_chars = set(name) - VALID_NAME_CHARACTERS
-        if len(invalid_chars) > 0:
-            error_msg = f"Datapoint name contains invalid characters: {invalid_chars}"
-            raise InvalidNameError(error_msg)
+        _check_name(name, "Datapoint name")
 
     def recursively_get_datapoints(
         self, *, reconstruct: bool = True, parents: bool = True
@@ -413,33 +478,52 @@ class AbstractDataset(
         Reconstruction does not guarantee the safety of this method. See the relevant
         documentation sections for considerations.
 
+        """
+        return list(self.iter_datapoints(reconstruct=reconstruct, parents=parents))
+
+    def iter_datapoints(
+        self, *, reconstruct: bool = True, parents: bool = True
+    ) -> Iterator["AbstractDatapoint"]:
+        """Iterate over the datapoints of this dataset and its parents (iff parents).
+
+        Behaves as `recursively_get_datapoints` but each datapoint is only
+        instantiated when it is reached, so the iteration can be stopped early without
+        the datapoints of every parent being instantiated.
+
+        Parameters
+        ----------
+        reconstruct : bool
+            See `recursively_get_datapoints`. The tree is reconstructed when the first
+            datapoint is requested rather than when this method is called.
+
+        parents : bool
+            If False, only the datapoints for this dataset are iterated over.
+
         """
         if reconstruct:
             db = self.database()
-            path_to_db = self.path_to_database()
-            this_dataset = db.recursively_get_dataset("/".join(path_to_db))
-            return this_dataset.recursively_get_datapoints(
-                reconstruct=False, parents=parents
-            )
+            this_dataset = db.recursively_get_dataset(self.fullname())
+            yield from this_dataset.iter_datapoints(reconstruct=False, parents=parents)
+            return
 
-        datapoints = [self.get_datapoint(name) for name in self.datapoints]
+        # reconstruct is False from here because the tree has already been
+        # reconstructed (if requested) and is therefore safe.
+        dataset = self
+        while True:
+            for name in dataset.datapoints:
+                yield dataset.get_datapoint(name)
 
-        if not parents:
-            return datapoints
+            if not parents or dataset.parent.is_database:
+                return
 
-        if self.parent.is_database:
-            return datapoints
-
-        # safe is False here because the first time the method is called with
-        # safe the entire tree is reconstructed and is therefore safe.
-        return datapoints + self.parent.recursively_get_datapoints(
-            reconstruct=False, parents=parents
-        )
+            dataset = dataset.parent
 
 
 class AbstractDatapoint(_TreeNode, _AbstractHasDataAndFilesMixin):
     """Abstract base class for a Datapoint."""
 
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def name(self) -> str:
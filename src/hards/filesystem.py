@@ -4,13 +4,32 @@ Generally the only object that should be instantiated by the user is the
 FilesystemDatabase. Databases and datapoints should be instantiated by calling methods
 on the database (and subsequently databases) which will handle other object
 instantiations.
+
+Data is serialised with ``orjson`` when it is installed (``pip install hards[fast]``)
+and the standard library ``json`` otherwise.
+
+All filesystem operations are performed in the calling thread unless the database is
+given ``io_workers``, in which case the independent operations of creating datasets, and
+the listing of directories when the database is rescanned, are spread over that
+many threads. This can help on high latency (e.g. network) filesystems but does not
+make the implementation thread safe. The threads run until the database is closed.
 """
 
+import errno
 import json
+import os
+import re
 import shutil
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any, Union
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .api import (
     AbstractDatabase,
     AbstractDatapoint,
@@ -18,16 +37,27 @@ from .api import (
     AlreadyExistsError,
     DoesNotExistError,
     HARDSError,
+    _split_dataset_path,
 )
 
 _CHILDREN_DIRECTORY_NAME = "children"
 _DATAPOINTS_DIRECTORY_NAME = "datapoints"
 _DATA_FILE_NAME = "data.json"
 _FILES_DIRECTORY_NAME = "files"
+_TEMPORARY_FILE_SUFFIX = ".tmp"
+# the number of directories listed ahead of time when scanning the tree with a pool
+_PREFETCHED_LISTINGS = 8
+# errors raised by copy_file_range when it cannot copy between the given files
+_COPY_FILE_RANGE_UNSUPPORTED_ERRNOS = frozenset((
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.EOPNOTSUPP,
+    errno.EXDEV,
+))
 
 
 def _error_msg_missing(
-    location: Path,
+    location: str,
     missing: str,
     class_name: str,
     missing_type: str = "directory",
@@ -38,15 +68,179 @@ def _error_msg_missing(
     )
 
 
+def _json_dumps(data: dict[str, Any]) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+# the serialiser is chosen once, on import, rather than on every call
+if orjson is not None:
+    # orjson is only used where it gives the same result as json, anything else (e.g.
+    # non-string keys, subclasses, or integers beyond 64 bits) is refused by orjson
+    # with these options and serialised by json instead
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+    _ORJSON_OPTIONS |= orjson.OPT_PASSTHROUGH_SUBCLASS
+    # orjson reads integers beyond 64 bits as floats, which have at least 19 digits
+    _search_long_integer = re.compile(rb"\d{19}").search
+
+    def _dumps(data: dict[str, Any]) -> bytes:
+        try:
+            serialised = orjson.dumps(data, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return _json_dumps(data)
+
+        # orjson writes NaN and infinities as null whereas json keeps them
+        if b"null" in serialised:
+            return _json_dumps(data)
+        return serialised
+
+    def _loads(serialised: bytes) -> dict[str, Any]:
+        # json also reads NaN and infinities, which orjson refuses
+        if _search_long_integer(serialised) is None:
+            try:
+                return orjson.loads(serialised)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(serialised)
+
+else:
+    _dumps = _json_dumps
+    _loads = json.loads
+
+
 class FilesystemError(HARDSError):
     """An error arising from the filesystem implementation of the abstract API."""
 
 
+def _write_file(location: str, contents: bytes, *, new: bool = False) -> None:
+    # the contents are written with the fewest possible system calls, without the
+    # buffering of a file object. A new file must not already exist.
+    flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+    flags |= os.O_EXCL if new else os.O_TRUNC
+
+    fd = os.open(location, flags, 0o666)
+    try:
+        written = os.write(fd, contents)
+        # a regular file is written in one call but a partial write is not an error
+        while written < len(contents):
+            written += os.write(fd, contents[written:])
+    finally:
+        os.close(fd)
+
+
+def _write_new_file(location: str, contents: bytes) -> None:
+    _write_file(location, contents, new=True)
+
+
+def _copy_file_range(source: Path, destination: str) -> bool:
+    # returns False, having maybe partially written the destination, if the files
+    # cannot be copied between by copy_file_range
+    with open(source, "rb") as src:
+        source_stat = os.fstat(src.fileno())
+        # the destination is only truncated once it is known not to be the source,
+        # which would otherwise be emptied
+        dst = os.open(
+            destination, os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o666
+        )
+        try:
+            destination_stat = os.fstat(dst)
+            if (destination_stat.st_dev, destination_stat.st_ino) == (
+                source_stat.st_dev,
+                source_stat.st_ino,
+            ):
+                error_msg = f"{source!r} and {destination!r} are the same file"
+                raise shutil.SameFileError(error_msg)
+            os.ftruncate(dst, 0)
+
+            remaining = source_stat.st_size
+            while remaining > 0:
+                try:
+                    copied = os.copy_file_range(src.fileno(), dst, remaining)
+                except OSError as e:
+                    if e.errno in _COPY_FILE_RANGE_UNSUPPORTED_ERRNOS:
+                        return False
+                    raise
+
+                # some filesystems report files as empty to copy_file_range
+                if copied == 0:
+                    return False
+                remaining -= copied
+        finally:
+            os.close(dst)
+
+    return True
+
+
+def _copy_file_contents(source: Path, destination: str) -> None:
+    # copy_file_range has the kernel copy the data (sharing blocks or copying on the
+    # server where the filesystem supports it) but is only used by shutil.copyfile
+    # from Python 3.14, on older versions copyfile falls back to sendfile
+    if not hasattr(os, "copy_file_range") or not _copy_file_range(source, destination):
+        shutil.copyfile(source, destination)
+
+
+def _check_is_file(file: Path) -> None:
+    if not file.is_file():
+        error_msg = (
+            f"File at location {file} does not exist(it could exist but not be a file)."
+        )
+        raise DoesNotExistError(error_msg)
+
+
+def _list_datasets(children_location: str) -> list[os.DirEntry]:
+    # symbolic links are not followed so that a link to an ancestor cannot make the
+    # walk endless. Linked datasets are instead found when they are requested.
+    try:
+        with os.scandir(children_location) as entries:
+            return [entry for entry in entries if entry.is_dir(follow_symlinks=False)]
+    except OSError:
+        # not a valid (or readable) dataset, which is only an error if it is requested
+        return []
+
+
+def _scandir_datasets(
+    children_location: str, io_pool: ThreadPoolExecutor | None = None
+) -> Iterator[tuple[str, os.DirEntry]]:
+    # yields the full name and directory entry of every dataset below the location,
+    # using the entry to tell datasets apart without an extra stat per entry. If given
+    # a pool, the directories next in line are listed on it while earlier ones are
+    # processed.
+    stack = [("", children_location, None)]
+
+    while stack:
+        prefix, children_location, listing = stack.pop()
+        entries = (
+            _list_datasets(children_location) if listing is None else listing.result()
+        )
+
+        for entry in entries:
+            fullname = prefix + entry.name
+            yield fullname, entry
+            stack.append((
+                f"{fullname}/",
+                f"{entry.path}{os.sep}{_CHILDREN_DIRECTORY_NAME}",
+                None,
+            ))
+
+        if io_pool is not None:
+            for i in range(max(len(stack) - _PREFETCHED_LISTINGS, 0), len(stack)):
+                prefix, children_location, listing = stack[i]
+                if listing is None:
+                    listing = io_pool.submit(_list_datasets, children_location)
+                    stack[i] = (prefix, children_location, listing)
+
+
 class _FilesystemHasChildrenMixin:
-    def _load_children(self, location: Path) -> None:
-        self._children_location = location / _CHILDREN_DIRECTORY_NAME
+    # the attributes are declared by the concrete classes
+    __slots__ = ()
+
+    def _init_children(
+        self, location: str, *, check: bool = True, new: bool = False
+    ) -> None:
+        # locations are kept as strings, with a trailing separator so that the location
+        # of a child is found by concatenation, and only made into a Path when needed
+        self._children_prefix = f"{location}{os.sep}{_CHILDREN_DIRECTORY_NAME}{os.sep}"
         # check that this directory is a database
-        if not self._children_location.exists():
+        if check and not new and not os.path.exists(self._children_prefix):
             error_msg = _error_msg_missing(
                 location,
                 _CHILDREN_DIRECTORY_NAME,
@@ -54,15 +248,41 @@ class _FilesystemHasChildrenMixin:
             )
             raise FilesystemError(error_msg)
 
-        self._children = [
-            directory.stem for directory in self._children_location.glob("*/")
-        ]
+        # the children are only listed when first needed so that objects used
+        # purely to navigate the tree do not scan their directory, unless the object
+        # is new and so is known to have no children
+        # children are kept as a map of their names to their locations, which is
+        # ordered, answers membership checks, and gives the location without joining
+        self._children_locations: dict[str, str] | None = {} if new else None
+        self._children_view: tuple[str, ...] | None = None
 
     @property
-    def children(self) -> list[str]:
-        return self._children
+    def _children_location(self) -> Path:
+        return Path(self._children_prefix)
+
+    def _load_children(self) -> None:
+        with os.scandir(self._children_prefix) as entries:
+            self._children_locations = {
+                entry.name: entry.path for entry in entries if entry.is_dir()
+            }
+
+    @property
+    def _children(self) -> dict[str, str]:
+        if self._children_locations is None:
+            self._load_children()
+        return self._children_locations
+
+    @property
+    def children(self) -> tuple[str, ...]:
+        # an immutable copy, remade only after a dataset is created, is returned so
+        # that the internal map can't be modified or change while being iterated
+        if self._children_view is None:
+            self._children_view = tuple(self._children)
+        return self._children_view
 
     def has_dataset(self, name: str) -> bool:
+        # the children are listed (once) rather than checking for the one directory so
+        # that further checks, and gets, of this object's children need no stat
         return name in self._children
 
     def get_dataset(self, name: str) -> "FilesystemDataset":
@@ -84,11 +304,18 @@ class _FilesystemHasChildrenMixin:
             If a dataset with the given name does not exist.
 
         """
-        dataset_location = self._children_location / name
-
-        if not dataset_location.exists():
-            error_msg = f"Database does not contain dataset {name}"
-            raise DoesNotExistError(error_msg)
+        # datasets cannot be deleted so a known dataset is returned without a stat
+        dataset_location = (
+            None
+            if self._children_locations is None
+            else self._children_locations.get(name)
+        )
+
+        if dataset_location is None:
+            dataset_location = self._children_prefix + name
+            if not os.path.isdir(dataset_location):
+                error_msg = f"Database does not contain dataset {name}"
+                raise DoesNotExistError(error_msg)
 
         return FilesystemDataset(dataset_location, self)
 
@@ -113,36 +340,100 @@ class _FilesystemHasChildrenMixin:
             If the dataset name contains invalid character.
 
         """
-        super().create_dataset(name)
-        dataset_location = self._children_location / name
+        return self.create_datasets([name])[0]
 
-        if dataset_location.exists():
-            error_msg = f"Dataset {name} already exists."
-            raise AlreadyExistsError(error_msg)
+    def create_datasets(self, names: Iterable[str]) -> list["FilesystemDataset"]:
+        """Create several datasets as children of this object.
 
-        dataset_location.mkdir()
+        Equivalent to calling `create_dataset` for each name except that every name is
+        validated before any dataset is created.
 
-        children_location = dataset_location / _CHILDREN_DIRECTORY_NAME
-        datapoints_location = dataset_location / _DATAPOINTS_DIRECTORY_NAME
-        files_location = dataset_location / _FILES_DIRECTORY_NAME
-        datafile_location = dataset_location / _DATA_FILE_NAME
-
-        children_location.mkdir()
-        datapoints_location.mkdir()
-        files_location.mkdir()
+        Parameters
+        ----------
+        names : Iterable[str]
+            The names of the new datasets.
 
-        with datafile_location.open("w") as f:
-            json.dump({}, f)
+        Returns
+        -------
+        list[FilesystemDataset]
+            The new dataset objects, in the same order as the names.
 
-        self._children.append(name)
+        Raises
+        ------
+        AlreadyExistsError
+            If a dataset with one of the names already exists. The datasets preceding
+            it will have been created.
+        InvalidNameError
+            If any of the dataset names contain invalid characters.
 
-        return FilesystemDataset(dataset_location, self)
+        """
+        names = list(names)
+        for name in names:
+            super().create_dataset(name)
+
+        empty_data = _dumps({})
+        io_pool = self.database()._io_pool  # noqa: SLF001
+        # the contents being created on the pool for each dataset
+        pending: dict[str, list[Future]] = {}
+        created = []
+
+        try:
+            for name in names:
+                dataset_location = self._children_prefix + name
+
+                try:
+                    os.mkdir(dataset_location)
+                except FileExistsError as e:
+                    error_msg = f"Dataset {name} already exists."
+                    raise AlreadyExistsError(error_msg) from e
+
+                # the contents of the dataset directory can be created in any order
+                dataset_prefix = f"{dataset_location}{os.sep}"
+                calls = (
+                    (os.mkdir, dataset_prefix + _CHILDREN_DIRECTORY_NAME),
+                    (os.mkdir, dataset_prefix + _DATAPOINTS_DIRECTORY_NAME),
+                    (os.mkdir, dataset_prefix + _FILES_DIRECTORY_NAME),
+                    (_write_new_file, dataset_prefix + _DATA_FILE_NAME, empty_data),
+                )
+                if io_pool is None:
+                    for function, *args in calls:
+                        function(*args)
+                    created.append(name)
+                else:
+                    pending[name] = [io_pool.submit(*call) for call in calls]
+        finally:
+            # a dataset is only listed once all of its contents have been created
+            wait([future for futures in pending.values() for future in futures])
+            created.extend(
+                name
+                for name, futures in pending.items()
+                if all(future.exception() is None for future in futures)
+            )
+            if created and self._children_locations is not None:
+                for name in created:
+                    self._children_locations[name] = self._children_prefix + name
+                self._children_view = None
+
+        # raise the first error from creating the contents of a dataset
+        for futures in pending.values():
+            for future in futures:
+                future.result()
+
+        return [
+            FilesystemDataset(self._children_prefix + name, self, _new=True)
+            for name in created
+        ]
 
 
 class _FilesystemHasDataMixin:
-    def _load_data(self, location: Path) -> None:
-        self._data_file = location / _DATA_FILE_NAME
-        if not self._data_file.exists():
+    # the attributes are declared by the concrete classes
+    __slots__ = ()
+
+    def _init_data(
+        self, location: str, *, check: bool = True, new: bool = False
+    ) -> None:
+        self._data_file = f"{location}{os.sep}{_DATA_FILE_NAME}"
+        if check and not new and not os.path.exists(self._data_file):
             error_msg = _error_msg_missing(
                 location,
                 _DATA_FILE_NAME,
@@ -151,25 +442,69 @@ class _FilesystemHasDataMixin:
             )
             raise FilesystemError(error_msg)
 
-        with self._data_file.open("r") as f:
-            self._data = json.load(f)
+        # the data is only read when first needed (a new object has no data)
+        self._data_dict: dict[str, Any] | None = {} if new else None
+        self._data_serialised: bytes | None = _dumps({}) if new else None
+
+    def _load_data(self) -> None:
+        # keep the serialised data so that writes that change nothing can be skipped
+        with open(self._data_file, "rb") as f:
+            self._data_serialised = f.read()
+        self._data_dict = _loads(self._data_serialised)
+
+    @property
+    def _data(self) -> dict[str, Any]:
+        if self._data_dict is None:
+            self._load_data()
+        return self._data_dict
 
     @property
     def data(self) -> dict[str, Any]:
         return self._data
 
     def add_data(self, new_data: dict[str, Any]) -> None:
-        self._data = {**self._data, **new_data}
+        """Add new data to the object.
+
+        Adding new data does not remove old data unless a key already exists,
+        in which case the old data of that key is overwritten by the newer data.
+        Several keys should be added in a single call because the entire data file
+        is rewritten by each call that changes the data.
+
+        Parameters
+        ----------
+        new_data : dict[str, Any]
+            New data, in key-value form, to be added to this objects data store.
+
+        """
+        data = {**self._data, **new_data}
+        # the data is only kept once written so that data which cannot be serialised
+        # (or written) does not leave this object out of step with the data file
+        serialised = _dumps(data)
+
+        if serialised != self._data_serialised:
+            self._write_data(serialised)
+        self._data_dict = data
+
+    def _write_data(self, serialised: bytes) -> None:
+        # write to a temporary file and move it over the data file so that the data
+        # file is never left partially written
+        temporary_file = self._data_file + _TEMPORARY_FILE_SUFFIX
+        _write_file(temporary_file, serialised)
+        os.replace(temporary_file, self._data_file)
 
-        with self._data_file.open("w") as f:
-            json.dump(self._data, f)
+        self._data_serialised = serialised
 
 
 class _FilesystemHasFilesMixin:
-    def _load_files(self, location: Path) -> None:
-        self._files_location = location / _FILES_DIRECTORY_NAME
+    # the attributes are declared by the concrete classes
+    __slots__ = ()
 
-        if not self._files_location.exists():
+    def _init_files(
+        self, location: str, *, check: bool = True, new: bool = False
+    ) -> None:
+        self._files_prefix = f"{location}{os.sep}{_FILES_DIRECTORY_NAME}{os.sep}"
+
+        if check and not new and not os.path.exists(self._files_prefix):
             error_msg = _error_msg_missing(
                 location,
                 _FILES_DIRECTORY_NAME,
@@ -177,44 +512,103 @@ class _FilesystemHasFilesMixin:
             )
             raise FilesystemError(error_msg)
 
-        self._files = [directory.name for directory in self._files_location.glob("*")]
+        # the files are only listed when first needed (a new object has no files)
+        self._files_locations: dict[str, str] | None = {} if new else None
+        self._files_view: tuple[str, ...] | None = None
+
+    @property
+    def _files_location(self) -> Path:
+        return Path(self._files_prefix)
+
+    def _load_files(self) -> None:
+        with os.scandir(self._files_prefix) as entries:
+            self._files_locations = {entry.name: entry.path for entry in entries}
+
+    @property
+    def _files(self) -> dict[str, str]:
+        if self._files_locations is None:
+            self._load_files()
+        return self._files_locations
 
     @property
-    def files(self) -> list[str]:
-        return self._files
+    def files(self) -> tuple[str, ...]:
+        if self._files_view is None:
+            self._files_view = tuple(self._files)
+        return self._files_view
 
     def has_file(self, name: str) -> bool:
         return name in self._files
 
     def get_file(self, name: str) -> Path:
-        location = self._files_location / name
+        location = (
+            None if self._files_locations is None else self._files_locations.get(name)
+        )
 
-        if not location.exists():
-            error_msg = f"Object does not manage a file {name}"
-            raise DoesNotExistError(error_msg)
+        if location is None:
+            location = self._files_prefix + name
+            if not os.path.isfile(location):
+                error_msg = f"Object does not manage a file {name}"
+                raise DoesNotExistError(error_msg)
 
-        return location
+        return Path(location)
 
     def add_file(
         self, file: Path, *, name: str | None = None, permissions: int = 0o400
     ) -> None:
         super().add_file(file, name=name)
-        if not file.exists() or not file.is_file:
-            error_msg = (
-                f"File at location {file} does not exist"
-                "(it could exist but not be a file)."
-            )
-            raise DoesNotExistError(error_msg)
+        _check_is_file(file)
+        self._copy_file(file, name or file.name, permissions)
 
-        new_name = name or file.name
-        destination = self._files_location / new_name
+    def add_files(self, files: Iterable[Path], *, permissions: int = 0o400) -> None:
+        """Add several files to be managed by this object.
 
-        if destination.exists():
-            Path(destination).chmod(0o700)
+        Equivalent to calling `add_file` for each file (keeping its name) except that
+        every file is checked to exist before any are copied.
 
-        shutil.copy2(file, destination, follow_symlinks=True)
-        Path(destination).chmod(permissions)
-        self._files.append(new_name)
+        Parameters
+        ----------
+        files : Iterable[Path]
+            Paths to the files to add to this object.
+        permissions : int, optional
+            The permissions given to the copied files.
+
+        Raises
+        ------
+        DoesNotExistError
+            If any of the files do not exist or are not files (e.g. a directory).
+
+        """
+        files = list(files)
+        for file in files:
+            _check_is_file(file)
+
+        for file in files:
+            self._copy_file(file, file.name, permissions)
+
+    def _copy_file(self, file: Path, new_name: str, permissions: int) -> None:
+        destination = self._files_prefix + new_name
+
+        # unlike copy2, the metadata that the chmod below would immediately replace is
+        # not copied
+        try:
+            _copy_file_contents(file, destination)
+        except PermissionError as e:
+            # the file is being overwritten but (as intended) is read-only, which is
+            # only dealt with when opening it fails rather than checked before copying.
+            # Otherwise the files directory itself cannot be written to.
+            if e.filename != destination or not os.path.exists(destination):
+                raise
+            # a managed file added again (e.g. through a link) is left read-only
+            if os.path.samefile(file, destination):
+                error_msg = f"{file!r} and {destination!r} are the same file"
+                raise shutil.SameFileError(error_msg) from e
+            os.chmod(destination, 0o700)
+            _copy_file_contents(file, destination)
+        os.chmod(destination, permissions)
+
+        if self._files_locations is not None and new_name not in self._files_locations:
+            self._files_locations[new_name] = destination
+            self._files_view = None
 
 
 class FilesystemDatabase(
@@ -223,14 +617,27 @@ class FilesystemDatabase(
 ):
     """Database represented by a directory on the filesystem."""
 
+    __slots__ = (
+        "_children_locations",
+        "_children_prefix",
+        "_children_view",
+        "_index",
+        "_io_pool",
+        "_location",
+    )
+
     @classmethod
-    def create_database(cls, location: Path) -> "FilesystemDatabase":
+    def create_database(
+        cls, location: Path, *, io_workers: int = 0
+    ) -> "FilesystemDatabase":
         """Create a database at the given location in the filesystem.
 
         Parameters
         ----------
         location : Path
             The location to create the directory that will represent the database.
+        io_workers : int, optional
+            See `FilesystemDatabase.__init__`.
 
         Returns
         -------
@@ -238,29 +645,137 @@ class FilesystemDatabase(
             The new database object.
 
         """
-        location.mkdir(parents=True)
-
-        children_dir = location / _CHILDREN_DIRECTORY_NAME
-        children_dir.mkdir()
+        os.makedirs(location)
+        os.mkdir(os.path.join(location, _CHILDREN_DIRECTORY_NAME))
 
-        return cls(location)
+        return cls(location, io_workers=io_workers)
 
-    def __init__(self, location: Path) -> None:
+    def __init__(self, location: Path, *, io_workers: int = 0) -> None:
         """Initialise a filesystem database.
 
         Parameters
         ----------
         location : Path
             The location of the directory that represents the database.
+        io_workers : int, optional
+            The number of threads used to create the contents of new datasets and to
+            list directories ahead of time when rescanning. By default (0)
+            everything is done in the calling thread. The threads are stopped by
+            `close`, or on leaving a ``with`` block using the database.
 
         """
-        self._load_children(location)
+        self._init_children(os.fspath(location))
         self._location = location
 
+        self._io_pool = ThreadPoolExecutor(io_workers) if io_workers > 0 else None
+
+        # full names of datasets to their location, added to by each recursive get
+        self._index: dict[str, str] = {}
+
     @property
     def name(self) -> str:  # noqa: D102
         return self._location.stem
 
+    def __enter__(self) -> "FilesystemDatabase":
+        """Use the database in a ``with`` block, closing it at the end."""
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        """Close the database at the end of a ``with`` block."""
+        self.close()
+
+    def close(self) -> None:
+        """Stop the threads used for filesystem operations (see ``io_workers``).
+
+        The database can still be used once closed but every operation is then done
+        in the calling thread. Closing a database without ``io_workers`` does nothing.
+        """
+        if self._io_pool is not None:
+            self._io_pool.shutdown()
+            self._io_pool = None
+
+    def rescan(self) -> None:
+        """Rebuild the index of dataset locations used by `recursively_get_dataset`.
+
+        The index is otherwise built up by `recursively_get_dataset`, which indexes
+        each dataset it finds by following the tree, so only the datasets that are
+        requested are ever read. Rescanning instead indexes every dataset by walking
+        the entire tree, which is worthwhile before requesting many datasets of a large
+        database. Datasets removed outside of HARDS are dropped from the index when
+        they are next requested.
+        """
+        self._index = {
+            fullname: entry.path
+            for fullname, entry in _scandir_datasets(
+                self._children_prefix, self._io_pool
+            )
+        }
+
+    def recursively_get_dataset(self, name: str) -> "FilesystemDataset":
+        """Recursively follow a tree of datasets and return the final dataset.
+
+        Parameters
+        ----------
+        name : str
+            The name of the datasets to follow and the dataset to return of the form
+            `<intermediate dataset>/<intermediate dataset>/<...>/<dataset of interest>`
+
+        Returns
+        -------
+        FilesystemDataset
+            The dataset object.
+
+        Raises
+        ------
+        DoesNotExistError
+            If any of the intermediate datasets do not exist.
+
+        """
+        fullnames = []
+        locations = []
+        fullname = ""
+        for dataset_name in _split_dataset_path(name):
+            fullname = f"{fullname}/{dataset_name}" if fullname else dataset_name
+            location = self._index.get(fullname)
+
+            # datasets that are not yet indexed are found from the location of
+            # their parent and then indexed
+            if location is None:
+                location = (
+                    f"{locations[-1]}{os.sep}{_CHILDREN_DIRECTORY_NAME}{os.sep}"
+                    if locations
+                    else self._children_prefix
+                ) + dataset_name
+                if not os.path.isdir(location):
+                    error_msg = f"Database does not contain dataset {fullname}"
+                    raise DoesNotExistError(error_msg)
+                self._index[fullname] = location
+
+            fullnames.append(fullname)
+            locations.append(location)
+
+        dataset = self
+        try:
+            for location in locations:
+                dataset = FilesystemDataset(location, dataset)
+        except FilesystemError:
+            if os.path.isdir(location):
+                raise
+            # the dataset was removed outside of HARDS after it was indexed, so it (and
+            # its descendants) are forgotten and looked for again
+            self._forget_indexed(fullnames[locations.index(location)])
+            return self.recursively_get_dataset(name)
+
+        return dataset
+
+    def _forget_indexed(self, name: str) -> None:
+        prefix = f"{name}/"
+        self._index = {
+            fullname: location
+            for fullname, location in self._index.items()
+            if fullname != name and not fullname.startswith(prefix)
+        }
+
 
 class FilesystemDataset(
     _FilesystemHasFilesMixin,
@@ -270,31 +785,64 @@ class FilesystemDataset(
 ):
     """Dataset represented by a directory on the filesystem."""
 
+    __slots__ = (
+        "_children_locations",
+        "_children_prefix",
+        "_children_view",
+        "_data_dict",
+        "_data_file",
+        "_data_serialised",
+        "_database",
+        "_datapoints",
+        "_datapoints_prefix",
+        "_datapoints_view",
+        "_files_locations",
+        "_files_prefix",
+        "_files_view",
+        "_location_str",
+        "_parent",
+    )
+
     def __init__(
         self,
-        location: Path,
+        location: Path | str,
         parent: Union[FilesystemDatabase, "FilesystemDataset"],
+        *,
+        _trusted: bool = False,
+        _new: bool = False,
     ) -> None:
         """Initialise a filesystem dataset.
 
         Parameters
         ----------
-        location : Path
+        location : Path | str
             The location of the directory that represents the dataset.
         parent : FilesystemDatabase | FilesystemDataset
             The parent object of this dataset.
+        _trusted : bool, optional
+            Skip checking the location is a valid dataset. For internal use when the
+            dataset has been validated by another instance.
+        _new : bool, optional
+            The dataset has just been created, so is valid and empty and does not need
+            to be read from the filesystem. For internal use.
 
         """
-        self._load_files(location)
-        self._load_data(location)
-        self._load_children(location)
+        self._location_str = location = os.fspath(location)
+        check = not _trusted
+
+        self._init_files(location, check=check, new=_new)
+        self._init_data(location, check=check, new=_new)
+        self._init_children(location, check=check, new=_new)
 
-        self._location = location
         self._parent = parent
+        # the database is found once rather than by walking up the tree on each call
+        self._database = parent.database()
 
-        self._datapoints_location = location / _DATAPOINTS_DIRECTORY_NAME
+        self._datapoints_prefix = (
+            f"{location}{os.sep}{_DATAPOINTS_DIRECTORY_NAME}{os.sep}"
+        )
 
-        if not self._datapoints_location.exists():
+        if check and not _new and not os.path.exists(self._datapoints_prefix):
             error_msg = _error_msg_missing(
                 location,
                 _DATAPOINTS_DIRECTORY_NAME,
@@ -302,22 +850,43 @@ class FilesystemDataset(
             )
             raise FilesystemError(error_msg)
 
-        self._datapoints = [
-            directory.stem for directory in self._datapoints_location.glob("*/")
-        ]
+        # the datapoints' names mapped to their locations, like the children
+        self._datapoints: dict[str, str]
+        if _new:
+            self._datapoints = {}
+        else:
+            with os.scandir(self._datapoints_prefix) as entries:
+                self._datapoints = {
+                    entry.name: entry.path for entry in entries if entry.is_dir()
+                }
+        self._datapoints_view: tuple[str, ...] | None = None
+
+    @property
+    def _location(self) -> Path:
+        return Path(self._location_str)
+
+    @property
+    def _datapoints_location(self) -> Path:
+        return Path(self._datapoints_prefix)
 
     @property
     def parent(self) -> Union[FilesystemDatabase, "FilesystemDataset"]:
         """Return the parent of the Datset."""
         return self._parent
 
+    def database(self) -> FilesystemDatabase:
+        """Return the database this dataset belongs to."""
+        return self._database
+
     @property
     def name(self) -> str:  # noqa: D102
-        return self._location.stem
+        return os.path.basename(self._location_str)
 
     @property
-    def datapoints(self) -> list[str]:  # noqa: D102
-        return self._datapoints
+    def datapoints(self) -> tuple[str, ...]:  # noqa: D102
+        if self._datapoints_view is None:
+            self._datapoints_view = tuple(self._datapoints)
+        return self._datapoints_view
 
     def has_datapoint(self, name: str) -> bool:  # noqa: D102
         return name in self._datapoints
@@ -341,11 +910,13 @@ class FilesystemDataset(
             If the datapoint does not exist.
 
         """
-        datapoint_location = self._datapoints_location / name
+        datapoint_location = self._datapoints.get(name)
 
-        if not datapoint_location.exists():
-            error_msg = f"Dataset does not contain datapoint {name}"
-            raise DoesNotExistError(error_msg)
+        if datapoint_location is None:
+            datapoint_location = self._datapoints_prefix + name
+            if not os.path.isdir(datapoint_location):
+                error_msg = f"Dataset does not contain datapoint {name}"
+                raise DoesNotExistError(error_msg)
 
         return FilesystemDatapoint(datapoint_location, self)
 
@@ -371,24 +942,58 @@ class FilesystemDataset(
 
         """
         super().create_datapoint(name)
-        datapoint_location = self._datapoints_location / name
+        datapoint_location = self._datapoints_prefix + name
 
-        if datapoint_location.exists():
+        try:
+            os.mkdir(datapoint_location)
+        except FileExistsError as e:
             error_msg = f"Datapoint {name} already exists."
-            raise AlreadyExistsError(error_msg)
+            raise AlreadyExistsError(error_msg) from e
 
-        datapoint_location.mkdir()
+        os.mkdir(f"{datapoint_location}{os.sep}{_FILES_DIRECTORY_NAME}")
+        _write_new_file(f"{datapoint_location}{os.sep}{_DATA_FILE_NAME}", _dumps({}))
 
-        files_location = datapoint_location / _FILES_DIRECTORY_NAME
-        files_location.mkdir()
+        self._datapoints[name] = datapoint_location
+        self._datapoints_view = None
 
-        datafile_location = datapoint_location / _DATA_FILE_NAME
-        with datafile_location.open("w") as f:
-            json.dump({}, f)
+        return FilesystemDatapoint(datapoint_location, self, _new=True)
 
-        self._datapoints.append(name)
+    def iter_datapoints(
+        self, *, reconstruct: bool = True, parents: bool = True
+    ) -> Iterator["FilesystemDatapoint"]:
+        """Iterate over the datapoints of this dataset and its parents (iff parents).
 
-        return FilesystemDatapoint(datapoint_location, self)
+        Behaves as `recursively_get_datapoints` but each datapoint is only
+        instantiated when it is reached, so the iteration can be stopped early without
+        the datapoints of every parent being instantiated.
+
+        Parameters
+        ----------
+        reconstruct : bool
+            See `recursively_get_datapoints`. The tree is reconstructed when the first
+            datapoint is requested rather than when this method is called.
+
+        parents : bool
+            If False, only the datapoints for this dataset are iterated over.
+
+        Notes
+        -----
+        This dataset is always reconstructed but its ancestors are not when `parents`
+        is False, because their datapoints are not needed.
+
+        """
+        if not reconstruct:
+            yield from super().iter_datapoints(reconstruct=False, parents=parents)
+            return
+
+        if parents and not self.parent.is_database:
+            parent = self.database().recursively_get_dataset(self.parent.fullname())
+        else:
+            # the ancestors' datapoints are not needed so they are not re-listed
+            parent = self.parent
+        this_dataset = FilesystemDataset(self._location_str, parent, _trusted=True)
+
+        yield from this_dataset.iter_datapoints(reconstruct=False, parents=parents)
 
 
 class FilesystemDatapoint(
@@ -396,29 +1001,60 @@ class FilesystemDatapoint(
 ):
     """Datapoint represented by a directory on the filesystem."""
 
-    def __init__(self, location: Path, parent: FilesystemDataset) -> None:
+    __slots__ = (
+        "_data_dict",
+        "_data_file",
+        "_data_serialised",
+        "_database",
+        "_files_locations",
+        "_files_prefix",
+        "_files_view",
+        "_location_str",
+        "_parent",
+    )
+
+    def __init__(
+        self,
+        location: Path | str,
+        parent: FilesystemDataset,
+        *,
+        _new: bool = False,
+    ) -> None:
         """Initialise a filesystem datapoint.
 
         Parameters
         ----------
-        location : Path
+        location : Path | str
             The location of the directory that represents the datapoint.
         parent : FilesystemDataset
             The parent object of this datapoint.
+        _new : bool, optional
+            The datapoint has just been created, so is valid and empty and does not need
+            to be read from the filesystem. For internal use.
 
         """
-        self._load_files(location)
-        self._load_data(location)
+        self._location_str = location = os.fspath(location)
+
+        self._init_files(location, new=_new)
+        self._init_data(location, new=_new)
 
-        self._location = location
         self._parent = parent
+        self._database = parent.database()
+
+    @property
+    def _location(self) -> Path:
+        return Path(self._location_str)
 
     @property
     def name(self) -> str:
         """The name of the datapoint."""
-        return self._location.stem
+        return os.path.basename(self._location_str)
 
     @property
     def parent(self) -> FilesystemDataset:
         """The parent Dataset of this Datapoint."""
         return self._parent
+
+    def database(self) -> FilesystemDatabase:
+        """Return the database this datapoint belongs to."""
+        return self._database
@@ -1,7 +1,12 @@
 """Tests for the `FilesystemDatabase` class."""
 
+import errno
+import shutil
+
 import pytest
 
+from hards import filesystem
+from hards.api import InvalidNameError
 from hards.filesystem import AlreadyExistsError, DoesNotExistError, FilesystemDatabase
 
 
@@ -43,4 +48,173 @@ def test_creating_dataset(filesystem_db):
 
     assert filesystem_db.has_dataset("test_dataset")
     assert len(filesystem_db.children) == 1
+    assert filesystem_db._children == {"test_dataset": dataset._location_str}
     assert filesystem_db.get_dataset("test_dataset")._location == dataset._location
+
+    # an instance that has not listed its children yet also finds the dataset
+    assert FilesystemDatabase(filesystem_db._location).has_dataset("test_dataset")
+    assert not FilesystemDatabase(filesystem_db._location).has_dataset("")
+
+
+def test_recursive_dataset_index(filesystem_db):
+    dataset = filesystem_db.create_dataset("test_dataset")
+    sub_dataset = dataset.create_dataset("test_sub_dataset")
+    filesystem_db.create_dataset("other_dataset")
+
+    # only the datasets on the path to the requested dataset are indexed
+    indexed_sub_dataset = filesystem_db.recursively_get_dataset(sub_dataset.fullname())
+    assert indexed_sub_dataset._location == sub_dataset._location
+    assert indexed_sub_dataset.parent._location == dataset._location
+    assert filesystem_db._index == {
+        "test_dataset": dataset._location_str,
+        "test_dataset/test_sub_dataset": sub_dataset._location_str,
+    }
+
+    # datasets created after the index is built are found and then indexed
+    sub_sub_dataset = sub_dataset.create_dataset("test_sub2_dataset")
+    assert (
+        filesystem_db.recursively_get_dataset(sub_sub_dataset.fullname())._location
+        == sub_sub_dataset._location
+    )
+    assert (
+        filesystem_db._index[sub_sub_dataset.fullname()]
+        == sub_sub_dataset._location_str
+    )
+
+    with pytest.raises(DoesNotExistError):
+        filesystem_db.recursively_get_dataset("test_dataset/random_dataset")
+
+    filesystem_db.rescan()
+    assert len(filesystem_db._index) == 4
+
+
+def test_creating_datasets(filesystem_db):
+    datasets = filesystem_db.create_datasets(["test_dataset_1", "test_dataset_2"])
+
+    assert [dataset.name for dataset in datasets] == [
+        "test_dataset_1",
+        "test_dataset_2",
+    ]
+    # the order of the children is not specified
+    assert set(filesystem_db.children) == {"test_dataset_1", "test_dataset_2"}
+    assert (
+        filesystem_db.get_dataset("test_dataset_2")._location == datasets[1]._location
+    )
+
+
+def test_error_on_creating_datasets_invalid_name(filesystem_db):
+    with pytest.raises(InvalidNameError):
+        filesystem_db.create_datasets(["test_dataset", "test*dataset"])
+
+    # no datasets are created if any name is invalid
+    assert not filesystem_db.has_dataset("test_dataset")
+
+
+def test_creating_datasets_with_io_workers(tmp_path):
+    db = FilesystemDatabase.create_database(tmp_path / "test_db", io_workers=4)
+    db.create_datasets([f"test_dataset_{i}" for i in range(10)])
+    dataset = db.create_dataset("test_dataset")
+
+    assert len(db.children) == 11
+    assert dataset._children_location.exists()
+    assert dataset._datapoints_location.exists()
+    assert dataset._files_location.exists()
+    assert dataset.data == {}
+
+    with pytest.raises(AlreadyExistsError):
+        db.create_datasets(["test_dataset_10", "test_dataset"])
+    assert len(db.children) == 12
+    db.close()
+
+
+def test_closing_database(tmp_path):
+    with FilesystemDatabase.create_database(tmp_path / "test_db", io_workers=2) as db:
+        io_pool = db._io_pool
+        db.create_dataset("test_dataset_1")
+
+    assert db._io_pool is None
+    with pytest.raises(RuntimeError):
+        io_pool.submit(print)
+
+    # a closed database does everything in the calling thread
+    db.create_dataset("test_dataset_2")
+    assert len(db.children) == 2
+    db.close()
+
+
+def test_error_on_creating_datasets_with_io_workers(tmp_path, monkeypatch):
+    db = FilesystemDatabase.create_database(tmp_path / "test_db", io_workers=2)
+    assert db.children == ()
+
+    write_new_file = filesystem._write_new_file
+
+    def fail_to_write_new_file(location, contents):
+        if "broken_dataset" in location:
+            raise OSError(errno.EIO, "Input/output error")
+        write_new_file(location, contents)
+
+    monkeypatch.setattr(filesystem, "_write_new_file", fail_to_write_new_file)
+    with pytest.raises(OSError, match="Input/output error"):
+        db.create_datasets(["test_dataset", "broken_dataset"])
+
+    # the partially created dataset is not listed as a child
+    assert db.children == ("test_dataset",)
+    assert not db.has_dataset("broken_dataset")
+    db.close()
+
+
+def test_recursive_dataset_index_with_io_workers(tmp_path):
+    db = FilesystemDatabase.create_database(tmp_path / "test_db", io_workers=2)
+    for dataset in db.create_datasets([f"test_dataset_{i}" for i in range(10)]):
+        dataset.create_datasets([f"test_sub_dataset_{i}" for i in range(10)])
+
+    db.rescan()
+    assert len(db._index) == 110
+    assert (
+        db.recursively_get_dataset("test_dataset_9/test_sub_dataset_9").fullname()
+        == "test_dataset_9/test_sub_dataset_9"
+    )
+    db.close()
+
+
+def test_recursive_dataset_index_with_symlinks(filesystem_db):
+    dataset = filesystem_db.create_dataset("test_dataset")
+    sub_dataset = dataset.create_dataset("test_sub_dataset")
+
+    # a link back to an ancestor would make the tree endless if it were followed
+    try:
+        (sub_dataset._children_location / "linked_dataset").symlink_to(
+            dataset._location, target_is_directory=True
+        )
+    except OSError:
+        pytest.skip("symbolic links cannot be created")
+
+    filesystem_db.rescan()
+    assert (
+        filesystem_db.recursively_get_dataset("test_dataset")._location
+        == dataset._location
+    )
+    assert (
+        filesystem_db.recursively_get_dataset(
+            "test_dataset/test_sub_dataset/linked_dataset/test_sub_dataset"
+        )._location
+        == sub_dataset._children_location / "linked_dataset/children/test_sub_dataset"
+    )
+
+
+def test_recursive_dataset_index_removed_dataset(filesystem_db):
+    dataset = filesystem_db.create_dataset("test_dataset")
+    dataset.create_dataset("test_sub_dataset")
+    filesystem_db.recursively_get_dataset("test_dataset/test_sub_dataset")
+
+    # datasets removed outside of HARDS are not found through the index
+    shutil.rmtree(dataset._location)
+    with pytest.raises(DoesNotExistError):
+        filesystem_db.recursively_get_dataset("test_dataset/test_sub_dataset")
+    with pytest.raises(DoesNotExistError):
+        filesystem_db.recursively_get_dataset("test_dataset")
+    assert filesystem_db._index == {}
+
+    # and are found again if recreated
+    filesystem_db.create_dataset("test_dataset")
+    assert filesystem_db.recursively_get_dataset("test_dataset").name == "test_dataset"
@@ -1,8 +1,10 @@
 """Tests for the `FilesystemDatapoint` class."""
 
+import weakref
+
 import pytest
 
-from hards.api import InvalidNameError
+from hards.api import AlreadyExistsError, InvalidNameError
 
 
 def test_datapoint_created(filesystem_dataset):
@@ -10,6 +12,9 @@ def test_datapoint_created(filesystem_dataset):
 
     assert datapoint.parent is filesystem_dataset
     assert datapoint.database() is filesystem_dataset.database()
+    # datapoints are numerous so they only hold their declared attributes
+    assert not hasattr(datapoint, "__dict__")
+    assert weakref.ref(datapoint)() is datapoint
     assert datapoint._files_location.exists()
     assert len(datapoint.data) == 0
 
@@ -28,3 +33,9 @@ def test_path_to_database(filesystem_dataset):
 def test_error_on_invalid_datapoint_name(filesystem_dataset):
     with pytest.raises(InvalidNameError):
         filesystem_dataset.create_datapoint("d&tapoint")
+
+
+def test_error_on_datapoint_existing(filesystem_dataset):
+    filesystem_dataset.create_datapoint("datapoint1")
+    with pytest.raises(AlreadyExistsError):
+        filesystem_dataset.create_datapoint("datapoint1")
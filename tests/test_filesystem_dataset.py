@@ -1,8 +1,15 @@
 """Tests for the `FilesystemDataset` class."""
 
+import errno
+import json
+import math
+import os
+import shutil
+
 import pytest
 
-from hards.api import InvalidNameError
+from hards.api import DoesNotExistError, InvalidNameError
+from hards.filesystem import FilesystemError
 
 
 def test_created_correctly(filesystem_db):
@@ -21,6 +28,7 @@ def test_created_correctly(filesystem_db):
     assert dataset_datapoints_location.exists()
     assert dataset_datafile_location.exists()
     assert dataset_files_location.exists()
+    assert dataset.database() is filesystem_db
     assert dataset.parent is filesystem_db
     assert len(dataset.children) == 0
     assert len(dataset.datapoints) == 0
@@ -38,6 +46,14 @@ def test_child_dataset(filesystem_dataset):
     assert child_dataset.parent is filesystem_dataset
 
 
+def test_child_datasets_listing_is_a_copy(filesystem_dataset):
+    children = filesystem_dataset.children
+    filesystem_dataset.create_dataset("test_sub_dataset")
+
+    assert children == ()
+    assert filesystem_dataset.children == ("test_sub_dataset",)
+
+
 def test_dataset_data(filesystem_dataset):
     filesystem_dataset.add_data({"test_data": 1})
 
@@ -54,6 +70,65 @@ def test_dataset_additional_data(filesystem_dataset):
     assert filesystem_dataset.data["more_test_data"] == "abcd"
 
 
+def test_dataset_data_written(filesystem_dataset):
+    filesystem_dataset.add_data({"test_data": 1})
+    filesystem_dataset.add_data({"test_data": 1})
+
+    datafile_location = filesystem_dataset._location / "data.json"
+    with datafile_location.open() as f:
+        assert json.load(f) == {"test_data": 1}
+    assert not (filesystem_dataset._location / "data.json.tmp").exists()
+
+
+def test_dataset_data_json_compatible(filesystem_dataset):
+    # the data is read and written as the standard library json would, whichever
+    # serialiser is installed
+    filesystem_dataset.add_data({
+        "nan": float("nan"),
+        "inf": float("inf"),
+        "big": 2**70,
+        "negative_big": -(2**63) - 1,
+        1: None,
+    })
+
+    with (filesystem_dataset._location / "data.json").open() as f:
+        written = json.load(f)
+    assert math.isnan(written["nan"])
+    assert written["inf"] == math.inf
+    assert written["big"] == 2**70
+    assert written["negative_big"] == -(2**63) - 1
+    assert written["1"] is None
+
+    data = filesystem_dataset.database().get_dataset("test_dataset").data
+    assert math.isnan(data["nan"])
+    assert data["big"] == 2**70
+    assert data["negative_big"] == -(2**63) - 1
+
+
+def test_dataset_data_written_by_json(filesystem_dataset):
+    with (filesystem_dataset._location / "data.json").open("w") as f:
+        json.dump({"nan": float("nan"), "big": 2**70}, f)
+
+    data = filesystem_dataset.database().get_dataset("test_dataset").data
+    assert math.isnan(data["nan"])
+    assert data["big"] == 2**70
+
+
+def test_error_on_data_not_serialisable(filesystem_dataset):
+    filesystem_dataset.add_data({"test_data": 1})
+
+    with pytest.raises(TypeError):
+        filesystem_dataset.add_data({"test_data_2": object()})
+
+    # the data that could not be written is not kept
+    assert filesystem_dataset.data == {"test_data": 1}
+    filesystem_dataset.add_data({"test_data_3": 3})
+    assert filesystem_dataset.database().get_dataset("test_dataset").data == {
+        "test_data": 1,
+        "test_data_3": 3,
+    }
+
+
 def test_dataset_files(filesystem_dataset, data_assets):
     filesystem_dataset.add_file(data_assets / "example_file.dat")
 
@@ -68,6 +143,48 @@ def test_dataset_files_overwrite(filesystem_dataset, data_assets):
     filesystem_dataset.add_file(data_assets / "example_file.dat")
     filesystem_dataset.add_file(data_assets / "example_file.dat")
     assert filesystem_dataset.has_file("example_file.dat")
+    assert len(filesystem_dataset.files) == 1
+
+
+def test_dataset_files_copy_fallback(filesystem_dataset, data_assets, monkeypatch):
+    def copy_file_range(*_args):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    # files are still copied if copy_file_range can't copy between them
+    monkeypatch.setattr(os, "copy_file_range", copy_file_range, raising=False)
+    filesystem_dataset.add_file(data_assets / "example_file.dat")
+
+    with filesystem_dataset.get_file("example_file.dat").open() as f:
+        assert f.read() == "file data!\n"
+
+
+def test_error_on_file_same_as_managed_file(filesystem_dataset, data_assets, tmp_path):
+    filesystem_dataset.add_file(data_assets / "example_file.dat")
+    managed_file = filesystem_dataset.get_file("example_file.dat")
+    linked_file = tmp_path / "example_file.dat"
+    linked_file.hardlink_to(managed_file)
+
+    for file in (managed_file, linked_file):
+        with pytest.raises(shutil.SameFileError):
+            filesystem_dataset.add_file(file)
+
+    # the managed file is left as it was
+    assert managed_file.read_text() == "file data!\n"
+    assert managed_file.stat().st_mode & 0o777 == 0o400
+
+
+def test_dataset_add_files(filesystem_dataset, data_assets):
+    other_file = data_assets / "other_file.dat"
+    other_file.write_text("other file data!\n")
+
+    filesystem_dataset.add_files([data_assets / "example_file.dat", other_file])
+
+    assert set(filesystem_dataset.files) == {"example_file.dat", "other_file.dat"}
+    with filesystem_dataset.get_file("other_file.dat").open() as f:
+        assert f.read() == "other file data!\n"
+
+    with pytest.raises(DoesNotExistError):
+        filesystem_dataset.add_files([other_file, data_assets / "missing_file.dat"])
 
 
 def test_dataset_files_read_only(filesystem_dataset, data_assets):
@@ -81,6 +198,20 @@ def test_dataset_files_read_only(filesystem_dataset, data_assets):
         f.write("test")
 
 
+@pytest.mark.skipif(
+    hasattr(os, "geteuid") and os.geteuid() == 0,
+    reason="permissions are not enforced for root",
+)
+def test_error_on_files_directory_read_only(filesystem_dataset, data_assets):
+    filesystem_dataset._files_location.chmod(0o500)
+
+    try:
+        with pytest.raises(PermissionError):
+            filesystem_dataset.add_file(data_assets / "example_file.dat")
+    finally:
+        filesystem_dataset._files_location.chmod(0o700)
+
+
 def test_dataset_files_rename(filesystem_dataset, data_assets):
     filesystem_dataset.add_file(
         data_assets / "example_file.dat", name="example_file.new_name.dat"
@@ -88,6 +219,9 @@ def test_dataset_files_rename(filesystem_dataset, data_assets):
     assert filesystem_dataset.has_file("example_file.new_name.dat")
     assert not filesystem_dataset.has_file("example_file.dat")
 
+    filesystem_dataset.add_file(data_assets / "example_file.dat", name="")
+    assert filesystem_dataset.has_file("example_file.dat")
+
 
 def test_dataset_same_from_scratch(filesystem_dataset):
     filesystem_dataset.add_data({"test_data_1": 2e4, "test_data_2": 1.4})
@@ -99,9 +233,34 @@ def test_dataset_same_from_scratch(filesystem_dataset):
     assert alt_dataset.data == filesystem_dataset.data
 
 
+def test_dataset_listings_from_scratch(filesystem_dataset, data_assets):
+    filesystem_dataset.create_dataset("child_dataset")
+    filesystem_dataset.add_file(data_assets / "example_file.dat")
+
+    alt_dataset = filesystem_dataset.database().get_dataset("test_dataset")
+
+    assert alt_dataset.has_dataset("child_dataset")
+    assert alt_dataset.has_file("example_file.dat")
+    assert alt_dataset.children == ("child_dataset",)
+    assert alt_dataset.files == ("example_file.dat",)
+    assert alt_dataset.has_dataset("child_dataset")
+    assert not alt_dataset.has_file("random_file.dat")
+
+
+def test_dataset_name_with_suffix(filesystem_db):
+    dataset = filesystem_db.create_dataset("test_dataset.v1")
+
+    assert dataset.name == "test_dataset.v1"
+    assert filesystem_db.get_dataset("test_dataset.v1").fullname() == "test_dataset.v1"
+
+
 def test_error_on_invalid_dataset_name(filesystem_db):
     with pytest.raises(InvalidNameError):
         filesystem_db.create_dataset("file*")
+    with pytest.raises(InvalidNameError):
+        filesystem_db.create_dataset("dätaset")
+    with pytest.raises(InvalidNameError):
+        filesystem_db.create_dataset("")
 
 
 def test_error_on_invalid_file_name(filesystem_dataset, data_assets):
@@ -109,3 +268,15 @@ def test_error_on_invalid_file_name(filesystem_dataset, data_assets):
         filesystem_dataset.add_file(
             data_assets / "example_file.dat", name="invalid(filename).txt"
         )
+
+
+def test_error_on_file_not_a_file(filesystem_dataset, data_assets):
+    with pytest.raises(DoesNotExistError):
+        filesystem_dataset.add_file(data_assets)
+
+
+def test_error_on_invalid_dataset_directory(filesystem_db):
+    (filesystem_db._location / "children/not_a_dataset").mkdir()
+
+    with pytest.raises(FilesystemError):
+        filesystem_db.get_dataset("not_a_dataset")
@@ -1,5 +1,9 @@
 """Test the integration of the filesystem database management."""
 
+import pytest
+
+from hards.filesystem import DoesNotExistError, FilesystemDatabase
+
 
 def test_recursive_datapoints(filesystem_dataset):
     child_dataset = filesystem_dataset.create_dataset("child_dataset")
@@ -42,6 +46,7 @@ def test_recursive_dataset(filesystem_db):
     sub_dataset = dataset.create_dataset("test_sub_dataset")
     sub_sub_dataset = sub_dataset.create_dataset("test_sub2_dataset")
 
+    assert sub_sub_dataset.database() is filesystem_db
     assert (
         filesystem_db.recursively_get_dataset("test_dataset")._location
         == filesystem_db.get_dataset("test_dataset")._location
@@ -63,6 +68,21 @@ def test_recursive_dataset(filesystem_db):
             "test_dataset/test_sub_dataset/test_sub2_dataset"
         )._location
     )
+    assert (
+        sub_sub_dataset._location
+        == filesystem_db.recursively_get_dataset(
+            "/test_dataset//test_sub_dataset/test_sub2_dataset/"
+        )._location
+    )
+    assert (
+        sub_sub_dataset._location
+        == dataset.recursively_get_dataset(
+            "test_sub_dataset//test_sub2_dataset"
+        )._location
+    )
+
+    with pytest.raises(DoesNotExistError):
+        filesystem_db.recursively_get_dataset("/")
 
 
 def test_recursive_datapoint_is_safe(filesystem_db):
@@ -115,3 +135,42 @@ def test_recursive_datapoint_is_safe(filesystem_db):
         len(sub_sub_dataset.recursively_get_datapoints(reconstruct=True, parents=False))
         == 1
     )
+
+
+def test_recursive_datapoints_reconstruct_sees_other_instances(
+    filesystem_dataset, data_assets
+):
+    child_dataset = filesystem_dataset.create_dataset("child_dataset")
+    filesystem_dataset.create_datapoint("datapoint1")
+
+    assert len(child_dataset.recursively_get_datapoints()) == 1
+
+    # changes made through another instance of the parent, or another database on
+    # the same directory, are seen when the tree is reconstructed
+    filesystem_dataset.add_data({"k": 1})
+    filesystem_dataset.add_file(data_assets / "example_file.dat")
+    other_db = FilesystemDatabase(filesystem_dataset.database()._location)
+    other_db.get_dataset("test_dataset").create_datapoint("datapoint2")
+
+    datapoints = child_dataset.recursively_get_datapoints()
+    assert len(datapoints) == 2
+    assert datapoints[0].parent.data == {"k": 1}
+    assert datapoints[0].parent.has_file("example_file.dat")
+
+
+def test_iter_datapoints(filesystem_dataset):
+    child_dataset = filesystem_dataset.create_dataset("child_dataset")
+    filesystem_dataset.create_datapoint("datapoint1")
+    child_dataset.create_datapoint("datapoint2")
+
+    assert next(child_dataset.iter_datapoints()).name == "datapoint2"
+    assert [
+        datapoint.name for datapoint in child_dataset.iter_datapoints(reconstruct=False)
+    ] == ["datapoint2", "datapoint1"]
+    assert len(list(child_dataset.iter_datapoints(parents=False))) == 1
+
+    # a datapoint created through another instance is seen without reconstructing
+    # the ancestors
+    filesystem_dataset.get_dataset("child_dataset").create_datapoint("datapoint3")
+    assert len(list(child_dataset.iter_datapoints(parents=False))) == 2
+    assert len(list(child_dataset.iter_datapoints(reconstruct=False))) == 2